@@ -4,8 +4,9 @@
 import curses
 from argparse import SUPPRESS, ArgumentParser, Namespace
 from collections import deque
-from enum import Enum
-from random import randint
+from enum import IntEnum
+from itertools import repeat
+from random import choice, randint
 from typing import Iterable, Iterator
 
 from working_initscr import wrapper
@@ -30,6 +31,8 @@ COLORS = {
 class Board:
     """Represent a board for the snake to move on"""
 
+    __slots__ = ("_rows", "_cols", "_background_char", "_background_row")
+
     def __init__(
         self,
         rows: int,
@@ -39,6 +42,7 @@ class Board:
         self._rows = rows
         self._cols = cols
         self._background_char = background_char
+        self._background_row = background_char * cols
 
     def init(
         self,
@@ -49,8 +53,7 @@ class Board:
     ) -> None:
         """Initialize the board by outputting the background and bottom text."""
         for y in range(self._rows):
-            for x in range(self._cols):
-                stdscr.addch(y, x, self._background_char, bg_color)
+            stdscr.addstr(y, 0, self._background_row, bg_color)
 
         stdscr.addstr(
             self._rows,
@@ -82,15 +85,17 @@ class Board:
 class Location:
     """Represent a location with an x and y coordinate"""
 
-    def __init__(self, x: int, y: int):
+    __slots__ = ("_x", "_y")
+
+    def __init__(self, x: int, y: int) -> None:
         self._x = x
         self._y = y
 
-    def get_x(self):
+    def get_x(self) -> int:
         """Get the x coordinate"""
         return self._x
 
-    def get_y(self):
+    def get_y(self) -> int:
         """Get the y coordinate"""
         return self._y
 
@@ -99,9 +104,11 @@ class Location:
             isinstance(other, Location) and self._x == other._x and self._y == other._y
         )
 
+    def __hash__(self) -> int:
+        return hash((self._x, self._y))
+
     def __iter__(self) -> Iterator[int]:
-        yield self._x
-        yield self._y
+        return iter((self._x, self._y))
 
     def __repr__(self) -> str:
         return f"({self._x}, {self._y})"
@@ -110,6 +117,15 @@ class Location:
 class Snake:
     """Represent a snake for the game"""
 
+    __slots__ = (
+        "_body_char",
+        "_head_char",
+        "_head",
+        "_body",
+        "_occupied",
+        "_color",
+    )
+
     def __init__(  # pylint: disable=too-many-arguments
         self,
         body_char: str,
@@ -123,8 +139,8 @@ class Snake:
         # self._max_speed = max_speed
         self._head = Location(5, 5)
         self._body: deque[Location] = deque((Location(4, 5),))
-        for _ in range(cheat + 1):
-            self._body.append(Location(3, 5))
+        self._body.extend(repeat(Location(3, 5), cheat + 1))
+        self._occupied: set[Location] = {self._head, *self._body}
         self._color = color
 
     def display_head(self, stdscr: curses.window) -> None:
@@ -136,6 +152,18 @@ class Snake:
             self._color,
         )
 
+    def display_neck(self, stdscr: curses.window) -> None:
+        """Render the segment directly behind the head as body"""
+        if self._body_char == self._head_char:
+            return  # the old head already shows the body character
+        neck = self._body[0]
+        stdscr.addch(
+            neck.get_y(),
+            neck.get_x(),
+            self._body_char,
+            self._color,
+        )
+
     def display(self, stdscr: curses.window) -> None:
         """Render the snake"""
         self.display_head(stdscr)
@@ -155,35 +183,45 @@ class Snake:
         """Display a new head of the snake"""
         self._body.appendleft(self._head)
         self._head = head
+        self._occupied.add(head)
 
     def __contains__(self, item: Location) -> bool:
-        return item in self._body
+        return item in self._occupied
 
     def pop(self) -> Location:
         """Remove the last bit of the tail of the snake"""
-        return self._body.pop()
+        tail = self._body.pop()
+        # Segments can be stacked on the tail (see --cheat), so only free
+        # the cell once the last of them is gone
+        if not self._body or self._body[-1] != tail:
+            self._occupied.discard(tail)
+        return tail
 
     def __len__(self) -> int:
         return len(self._body) + 1
 
 
-class Direction(Enum):
+class Direction(IntEnum):
     """
     Represent the state the snake is currently in.
     Includes paused, direction snake is heading/facing/moving, and gameover
     """
 
-    UP = "up"
-    DOWN = "down"
-    LEFT = "left"
-    RIGHT = "right"
-    PAUSED = "paused"
-    GAMEOVER = "gameover"
+    UP = 0
+    DOWN = 1
+    LEFT = 2
+    RIGHT = 3
+    PAUSED = 4
+    GAMEOVER = 5
 
 
 class Food:
     """Represent the food the snake is currently trying to eat"""
 
+    __slots__ = ("_char", "_rows", "_cols", "_location", "_color")
+
+    _RANDOM_TRIES = 32
+
     def __init__(
         self,
         char: str,
@@ -201,17 +239,31 @@ class Food:
         """Return the food's current location"""
         return self._location
 
-    def reroll(self, snake: Snake) -> None:
-        """Randomly update the location of the food"""
-        while True:
-            loc = Location(
+    def reroll(self, snake: Snake) -> bool:
+        """
+        Move the food to a random cell not covered by the snake.
+        Return False if there is no such cell left.
+        """
+        for _ in range(self._RANDOM_TRIES):
+            location = Location(
                 randint(0, self._cols - 1),
                 randint(0, self._rows - 1),
             )
-            if loc in snake:
-                continue
-            self._location = loc
-            break
+            if location not in snake:
+                self._location = location
+                return True
+
+        # The board is nearly full, so pick from the cells that are left
+        free_cells = [
+            location
+            for x in range(self._cols)
+            for y in range(self._rows)
+            if (location := Location(x, y)) not in snake
+        ]
+        if not free_cells:
+            return False
+        self._location = choice(free_cells)
+        return True
 
     def display(self, stdscr: curses.window) -> None:
         """Render the food"""
@@ -223,6 +275,37 @@ class Food:
         )
 
 
+_KEYS: dict[int, Direction] = {
+    119: Direction.UP,
+    259: Direction.UP,
+    107: Direction.UP,
+    97: Direction.LEFT,
+    260: Direction.LEFT,
+    104: Direction.LEFT,
+    115: Direction.DOWN,
+    258: Direction.DOWN,
+    106: Direction.DOWN,
+    100: Direction.RIGHT,
+    261: Direction.RIGHT,
+    108: Direction.RIGHT,
+}
+_QUIT_KEYS = frozenset((113, 27))  # q, esc
+# (dx, dy) for each moving Direction, indexed by its value
+_DELTAS: tuple[tuple[int, int], ...] = (
+    (0, -1),  # UP
+    (0, 1),  # DOWN
+    (-1, 0),  # LEFT
+    (1, 0),  # RIGHT
+)
+# Opposite of each moving Direction, indexed by its value
+_OPPOSITES: tuple[Direction, ...] = (
+    Direction.DOWN,
+    Direction.UP,
+    Direction.RIGHT,
+    Direction.LEFT,
+)
+
+
 class Game:  # pylint: disable=too-many-instance-attributes
     """Runnable game object"""
 
@@ -237,6 +320,7 @@ class Game:  # pylint: disable=too-many-instance-attributes
         food_char: str,
         bg_color: int,
         food_color: int,
+        tick_timeout: int,
     ) -> None:
         self._stdscr = stdscr
         self._snake = snake
@@ -252,6 +336,13 @@ class Game:  # pylint: disable=too-many-instance-attributes
         self._score = len(snake)
         self._bg_color = bg_color
         # best_score = update_best_score(score)
+        self._tick_timeout = tick_timeout
+        self._stdscr.timeout(self._tick_timeout)
+        self._score_col = (
+            len(self._LONG_TEXT)
+            if self._board.is_large_enough(len(self._LONG_TEXT))
+            else len(self._SHORT_TEXT)
+        ) - 1
         self._board.init(
             self._stdscr,
             self._bg_color,
@@ -260,26 +351,22 @@ class Game:  # pylint: disable=too-many-instance-attributes
         )
         self._food.display(self._stdscr)
         self._snake.display(self._stdscr)
+        self._display_score()
 
     def _ensure_valid(self, new: Direction) -> Direction:
         """Disallow moving in the opposite direction from current"""
         if self._direction == Direction.PAUSED:
             unpause_heading = self._paused
             self._paused = Direction.PAUSED
+            self._stdscr.timeout(self._tick_timeout)
             return unpause_heading
 
         if new == Direction.PAUSED:
             self._paused = self._direction
+            self._stdscr.timeout(-1)  # nothing moves while paused, wait for a key
             return Direction.PAUSED
 
-        opposites: dict[Direction, Direction] = {
-            Direction.UP: Direction.DOWN,
-            Direction.DOWN: Direction.UP,
-            Direction.LEFT: Direction.RIGHT,
-            Direction.RIGHT: Direction.LEFT,
-        }
-
-        if new == opposites[self._direction]:
+        if new == _OPPOSITES[self._direction]:
             return self._direction
         return new
 
@@ -288,53 +375,32 @@ class Game:  # pylint: disable=too-many-instance-attributes
         If a key has been pressed, change the
         direction or pause the game
         """
-        keys: dict[int, Direction] = {
-            119: Direction.UP,
-            259: Direction.UP,
-            107: Direction.UP,
-            97: Direction.LEFT,
-            260: Direction.LEFT,
-            104: Direction.LEFT,
-            115: Direction.DOWN,
-            258: Direction.DOWN,
-            106: Direction.DOWN,
-            100: Direction.RIGHT,
-            261: Direction.RIGHT,
-            108: Direction.RIGHT,
-        }
         try:
             key = self._stdscr.getch()
         except KeyboardInterrupt:  # exit on ^C
             return Direction.GAMEOVER
-        if key in (113, 27):  # q, esc
+        if key in _QUIT_KEYS:
             return Direction.GAMEOVER
         if key == -1:  # no key provided
             return self._direction
-        return self._ensure_valid(keys.get(key, Direction.PAUSED))
+        return self._ensure_valid(_KEYS.get(key, Direction.PAUSED))
 
     def _get_new_head(self) -> Location:
         """Return the location of the snake's new head"""
         self._direction = self._get_new_direction()
         if self._direction == Direction.PAUSED:
             return Location(-1, -1)  # pause
-        addend = 1 if self._direction in (Direction.DOWN, Direction.RIGHT) else -1
+        if self._direction == Direction.GAMEOVER:
+            return self._snake.get_head()
+        delta_x, delta_y = _DELTAS[self._direction]
         head = self._snake.get_head()
-        new_x = head.get_x()
-        new_y = head.get_y()
-        if self._direction in (Direction.LEFT, Direction.RIGHT):
-            return Location(new_x + addend, new_y)
-        return Location(new_x, new_y + addend)
+        return Location(head.get_x() + delta_x, head.get_y() + delta_y)
 
     def _display_score(self) -> None:
         """Output the current score at the correct location"""
         self._stdscr.addstr(
             self._board.get_rows(),
-            (
-                len(self._LONG_TEXT)
-                if self._board.is_large_enough(len(self._LONG_TEXT))
-                else len(self._SHORT_TEXT)
-            )
-            - 1,
+            self._score_col,
             str(self._score),
             self._bg_color,
         )
@@ -353,11 +419,8 @@ class Game:  # pylint: disable=too-many-instance-attributes
                 return "Snake out of bounds horizontally"
             if new_head in self._snake:
                 return "Snake can't eat itself"
-            if new_head == self._food.get_location():
-                self._food.reroll(self._snake)
-                self._score += 1
-                # best_score = update_best_score(score)
-            else:
+            ate = new_head == self._food.get_location()
+            if not ate:
                 new_bg = self._snake.pop()
                 self._stdscr.addch(
                     new_bg.get_y(),
@@ -366,10 +429,17 @@ class Game:  # pylint: disable=too-many-instance-attributes
                     self._bg_color,
                 )
             self._snake.add_head(new_head)
+            if ate:
+                self._score += 1
+                # best_score = update_best_score(score)
+                self._display_score()
+                if not self._food.reroll(self._snake):
+                    return "Snake filled the board"
+                self._food.display(self._stdscr)
+            self._snake.display_neck(self._stdscr)
             self._snake.display_head(self._stdscr)
-            self._food.display(self._stdscr)
-            self._display_score()
-            self._stdscr.refresh()
+            self._stdscr.noutrefresh()
+            curses.doupdate()
 
     def get_score(self) -> int:
         """Return the current score"""
@@ -504,13 +574,15 @@ def main(stdscr: curses.window, args: Namespace) -> str:
 
     curses.curs_set(0)
     curses.use_default_colors()
+    if hasattr(curses, "set_escdelay"):  # ncurses only, absent on windows-curses
+        curses.set_escdelay(25)  # react to esc without waiting for a sequence
     stdscr.nodelay(True)
-    stdscr.timeout(1000 // args.speed)
 
     curses.init_pair(1, -1 if args.black_white else COLORS[args.color_bg], -1)
     curses.init_pair(2, -1 if args.black_white else COLORS[args.color_snake], -1)
     curses.init_pair(3, -1 if args.black_white else COLORS[args.color_food], -1)
 
+    max_y, max_x = stdscr.getmaxyx()
     game = Game(
         stdscr,
         Snake(
@@ -521,13 +593,14 @@ def main(stdscr: curses.window, args: Namespace) -> str:
             curses.color_pair(2),
         ),
         Board(
-            args.rows or stdscr.getmaxyx()[0] - 1,
-            args.columns or stdscr.getmaxyx()[1] - 1,
+            args.rows or max_y - 1,
+            args.columns or max_x - 1,
             args.char_bg,
         ),
         args.char_food,
         curses.color_pair(1),
         curses.color_pair(3),
+        1000 // args.speed,
     )
 
     return f"Game over: {game.run()}\nScore: {game.get_score()}"